@@ -129,7 +129,7 @@ class Chart(DictPropertiesEqMixin, DictReprTruncatedSequencesMixin):
         Returns:
             A ``Chart`` object, initialized with data parsed from ``fp``.
         """
-        lines = fp.read().splitlines()
+        lines = (line.rstrip("\r\n") for line in fp)
         data_sections = cls._partition_lines_by_data_section(lines)
         if not all(tag in data_sections for tag in cls._required_header_tags):
             raise ValueError(
@@ -149,13 +149,14 @@ class Chart(DictPropertiesEqMixin, DictReprTruncatedSequencesMixin):
             str, tuple[Instrument, Difficulty]
         ] = {d.value + i.value: (i, d) for i, d in itertools.product(Instrument, Difficulty)}
 
+        wanted_tracks = frozenset(want_tracks) if want_tracks is not None else None
         instrument_tracks = InstrumentTrackMap(collections.defaultdict(dict))
         for header_tag, data_section_lines in data_sections.items():
             if header_tag in instrument_track_name_to_instrument_difficulty_pair:
                 instrument_difficulty_pair = instrument_track_name_to_instrument_difficulty_pair[
                     header_tag
                 ]
-                if want_tracks is not None and instrument_difficulty_pair not in want_tracks:
+                if wanted_tracks is not None and instrument_difficulty_pair not in wanted_tracks:
                     continue
                 instrument, difficulty = instrument_difficulty_pair
                 track = InstrumentTrack.from_chart_lines(
@@ -171,27 +172,24 @@ class Chart(DictPropertiesEqMixin, DictReprTruncatedSequencesMixin):
         return cls(metadata, global_events_track, sync_track, instrument_tracks)
 
     @classmethod
-    def _partition_lines_by_data_section(cls, lines: Iterable[str]) -> dict[str, Iterable[str]]:
-        d: dict[str, Iterable[str]] = dict()
+    def _partition_lines_by_data_section(cls, lines: Iterable[str]) -> dict[str, list[str]]:
+        d: dict[str, list[str]] = dict()
         curr_header_tag = None
-        curr_first_line_index = None
-        curr_last_line_index = None
-        for i, line in enumerate(lines):
+        curr_lines: list[str] | None = None
+        for line in lines:
             if curr_header_tag is None:
                 m = cls._header_tag_regex_prog.match(line)
                 if not m:
                     raise RegexNotMatchError(cls._header_tag_regex, line)
                 curr_header_tag = m.group(1)
             elif line == "{":
-                curr_first_line_index = i + 1
+                curr_lines = []
             elif line == "}":
-                curr_last_line_index = i - 1
-                d[curr_header_tag] = itertools.islice(
-                    lines, curr_first_line_index, curr_last_line_index + 1
-                )
+                d[curr_header_tag] = curr_lines if curr_lines is not None else []
                 curr_header_tag = None
-                curr_first_line_index = None
-                curr_last_line_index = None
+                curr_lines = None
+            elif curr_lines is not None:
+                curr_lines.append(line)
         return d
 
     @typ.overload
@@ -35,7 +35,6 @@ class Event(DictPropertiesEqMixin, DictReprMixin):
     # TODO(P3): Figure out a way for the final closing parenthesis to wrap _around_ any additional
     # info added by subclass __str__ implementations.
     def __str__(self) -> str:
-        to_join = [f"{type(self).__name__}(t@{self.tick:07})"]
         as_str = (
             str(self.timestamp)
             # This normally converts to str with six decimal digits, but for integral timedeltas,
@@ -44,8 +43,7 @@ class Event(DictPropertiesEqMixin, DictReprMixin):
             if not self.timestamp.total_seconds().is_integer()
             else f"{self.timestamp}.000000"
         )
-        to_join.append(f": {as_str}")
-        return "".join(to_join)
+        return f"{type(self).__name__}(t@{self.tick:07}): {as_str}"
 
     @dataclasses.dataclass(kw_only=True, frozen=True)
     class ParsedData(abc.ABC):
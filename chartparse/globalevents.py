@@ -144,9 +144,7 @@ class GlobalEvent(Event):
         )
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f': "{self.value}"')
-        return "".join(to_join)
+        return f'{super().__str__()}: "{self.value}"'
 
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
     class ParsedData(Event.ParsedData, DictReprMixin):
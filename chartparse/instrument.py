@@ -474,6 +474,12 @@ class NoteEvent(Event):
     If this is ``None``, then the note is not a star power note.
     """
 
+    _hopo_state_to_string: typ.ClassVar[dict[HOPOState, str]] = {
+        HOPOState.TAP: "T",
+        HOPOState.HOPO: "H",
+        HOPOState.STRUM: "S",
+    }
+
     @functools.cached_property
     def longest_sustain(self) -> Ticks:
         """The length of the longest sustained note in this event.
@@ -640,22 +646,12 @@ class NoteEvent(Event):
         return StarPowerData(star_power_event_index=candidate_index), candidate_index
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f": sustain={self.sustain}")
-        to_join.append(f": {self.note}")
-
-        if self.star_power_data:
-            to_join.append("*")
-
-        hopo_state_to_string = {
-            HOPOState.TAP: "T",
-            HOPOState.HOPO: "H",
-            HOPOState.STRUM: "S",
-        }
-
-        to_join.append(f" [hopo_state={hopo_state_to_string[self.hopo_state]}]")
-
-        return "".join(to_join)
+        star_power_marker = "*" if self.star_power_data else ""
+        hopo_state_string = self._hopo_state_to_string[self.hopo_state]
+        return (
+            f"{super().__str__()}: sustain={self.sustain}: {self.note}{star_power_marker}"
+            f" [hopo_state={hopo_state_string}]"
+        )
 
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
     class ParsedData(Event.ParsedData, DictReprMixin):
@@ -777,9 +773,7 @@ class SpecialEvent(Event):
         return tick >= self.end_tick
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f": sustain={self.sustain}")
-        return "".join(to_join)
+        return f"{super().__str__()}: sustain={self.sustain}"
 
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
     class ParsedData(Event.ParsedData, DictReprMixin):
@@ -884,9 +878,7 @@ class TrackEvent(Event):
         )
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f': "{self.value}"')
-        return "".join(to_join)
+        return f'{super().__str__()}: "{self.value}"'
 
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
     class ParsedData(Event.ParsedData, DictReprMixin):
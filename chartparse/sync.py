@@ -170,9 +170,7 @@ class TimeSignatureEvent(Event):
         )
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f": {self.upper_numeral}/{self.lower_numeral}")
-        return "".join(to_join)
+        return f"{super().__str__()}: {self.upper_numeral}/{self.lower_numeral}"
 
     @typ.final
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
@@ -293,9 +291,7 @@ class BPMEvent(Event):
         )
 
     def __str__(self) -> str:
-        to_join = [super().__str__()]
-        to_join.append(f": {self.bpm} BPM")
-        return "".join(to_join)
+        return f"{super().__str__()}: {self.bpm} BPM"
 
     @typ.final
     @dataclasses.dataclass(kw_only=True, frozen=True, repr=False)
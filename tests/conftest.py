@@ -33,7 +33,7 @@ from tests.helpers import defaults, unsafe
 from tests.helpers.sync import BPMEventsWithMock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_chart_line() -> str:
     return defaults.invalid_chart_line
 
@@ -48,7 +48,7 @@ def minimal_instrument_tracks(minimal_instrument_track: InstrumentTrack) -> Inst
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_instrument_tracks(default_instrument_track: InstrumentTrack) -> InstrumentTrackMap:
     return InstrumentTrackMap(
         {defaults.instrument: {defaults.difficulty: default_instrument_track}}
@@ -70,7 +70,9 @@ def minimal_chart(
     return c
 
 
-@pytest.fixture
+# The default_* fixtures are built once per session and shared, so tests must not mutate them; use
+# the minimal_* fixtures for that.
+@pytest.fixture(scope="session")
 def default_chart(
     default_metadata: Metadata,
     default_global_events_track: GlobalEventsTrack,
@@ -96,7 +98,7 @@ def minimal_event() -> Event:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_event() -> Event:
     return Event(tick=defaults.tick, timestamp=defaults.timestamp)
 
@@ -115,15 +117,9 @@ def minimal_instrument_track() -> InstrumentTrack:
     return it
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_instrument_track() -> InstrumentTrack:
-    return InstrumentTrack(
-        instrument=defaults.instrument,
-        difficulty=defaults.difficulty,
-        note_events=[defaults.note_event],
-        star_power_events=[defaults.star_power_event],
-        track_events=[defaults.track_event],
-    )
+    return defaults.instrument_track
 
 
 @pytest.fixture
@@ -146,7 +142,7 @@ def minimal_note_event_parsed_data() -> NoteEvent.ParsedData:
     return pd
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_note_event() -> NoteEvent:
     return defaults.note_event
 
@@ -160,7 +156,7 @@ def minimal_special_event() -> SpecialEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_special_event() -> SpecialEvent:
     return SpecialEvent(tick=defaults.tick, timestamp=defaults.timestamp, sustain=defaults.sustain)
 
@@ -174,7 +170,7 @@ def minimal_star_power_event() -> StarPowerEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_star_power_event() -> StarPowerEvent:
     return defaults.star_power_event
 
@@ -188,7 +184,7 @@ def minimal_track_event() -> TrackEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_track_event() -> TrackEvent:
     return defaults.track_event
 
@@ -205,13 +201,9 @@ def minimal_sync_track(minimal_bpm_events: BPMEvents) -> SyncTrack:
     return st
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_sync_track() -> SyncTrack:
-    return SyncTrack(
-        time_signature_events=[defaults.time_signature_event],
-        bpm_events=defaults.bpm_events,
-        anchor_events=[defaults.anchor_event],
-    )
+    return defaults.sync_track
 
 
 @pytest.fixture
@@ -224,7 +216,7 @@ def minimal_time_signature_event() -> TimeSignatureEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_time_signature_event() -> TimeSignatureEvent:
     return defaults.time_signature_event
 
@@ -238,7 +230,7 @@ def minimal_bpm_event() -> BPMEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_bpm_event() -> BPMEvent:
     return defaults.bpm_event
 
@@ -301,7 +293,7 @@ def minimal_anchor_event() -> AnchorEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_anchor_event() -> AnchorEvent:
     return defaults.anchor_event
 
@@ -318,13 +310,9 @@ def minimal_global_events_track() -> GlobalEventsTrack:
     return et
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_global_events_track() -> GlobalEventsTrack:
-    return GlobalEventsTrack(
-        text_events=[defaults.text_event],
-        section_events=[defaults.section_event],
-        lyric_events=[defaults.lyric_event],
-    )
+    return defaults.global_events_track
 
 
 @pytest.fixture
@@ -336,7 +324,7 @@ def minimal_global_event() -> GlobalEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_global_event() -> GlobalEvent:
     return defaults.global_event
 
@@ -350,7 +338,7 @@ def minimal_text_event() -> TextEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_text_event() -> TextEvent:
     return defaults.text_event
 
@@ -364,7 +352,7 @@ def minimal_section_event() -> SectionEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_section_event() -> SectionEvent:
     return defaults.section_event
 
@@ -378,7 +366,7 @@ def minimal_lyric_event() -> LyricEvent:
     return e
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_lyric_event() -> LyricEvent:
     return defaults.lyric_event
 
@@ -416,7 +404,7 @@ def minimal_metadata() -> Metadata:
     return m
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_metadata() -> Metadata:
     return Metadata(
         resolution=defaults.resolution,
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import math
 from datetime import timedelta
 
-from chartparse.globalevents import GlobalEvent, LyricEvent, SectionEvent, TextEvent
+from chartparse.globalevents import (
+    GlobalEvent,
+    GlobalEventsTrack,
+    LyricEvent,
+    SectionEvent,
+    TextEvent,
+)
 from chartparse.instrument import (
     Difficulty,
     HOPOState,
     Instrument,
+    InstrumentTrack,
     Note,
     NoteEvent,
     NoteTrackIndex,
@@ -17,7 +23,7 @@ from chartparse.instrument import (
     _SustainList,
 )
 from chartparse.metadata import Player2Instrument
-from chartparse.sync import AnchorEvent, BPMEvent, BPMEvents, TimeSignatureEvent
+from chartparse.sync import AnchorEvent, BPMEvent, BPMEvents, SyncTrack, TimeSignatureEvent
 from chartparse.tick import Tick, Ticks
 from chartparse.time import Timestamp
 
@@ -76,7 +82,8 @@ bpm_events = BPMEvents(events=[bpm_event], resolution=resolution)
 
 upper_time_signature_numeral = 4
 lower_time_signature_numeral = 8
-raw_lower_time_signature_numeral = str(int(math.log(lower_time_signature_numeral, 2)))
+# Moonscraper writes the lower numeral as its log2, i.e. the bit length less one for powers of 2.
+raw_lower_time_signature_numeral = str(lower_time_signature_numeral.bit_length() - 1)
 time_signature_event = TimeSignatureEvent(
     tick=tick,
     timestamp=timestamp,
@@ -92,6 +99,12 @@ time_signature_event_parsed_data = TimeSignatureEvent.ParsedData(
 anchor_event = AnchorEvent(tick=tick, timestamp=timestamp)
 anchor_event_parsed_data = AnchorEvent.ParsedData(tick=tick, microseconds=microseconds)
 
+sync_track = SyncTrack(
+    time_signature_events=[time_signature_event],
+    bpm_events=bpm_events,
+    anchor_events=[anchor_event],
+)
+
 global_event_value = "default_global_event_value"
 global_event = GlobalEvent(tick=tick, timestamp=timestamp, value=global_event_value)
 global_event_parsed_data = GlobalEvent.ParsedData(tick=tick, value=global_event_value)
@@ -108,6 +121,12 @@ lyric_event_value = "default_lyric_event_value"
 lyric_event = LyricEvent(tick=tick, timestamp=timestamp, value=lyric_event_value)
 lyric_event_parsed_data = LyricEvent.ParsedData(tick=tick, value=lyric_event_value)
 
+global_events_track = GlobalEventsTrack(
+    text_events=[text_event],
+    section_events=[section_event],
+    lyric_events=[lyric_event],
+)
+
 
 difficulty = Difficulty.EXPERT
 instrument = Instrument.GUITAR
@@ -144,8 +163,16 @@ track_event_parsed_data = TrackEvent.ParsedData(
     value=track_event_value,
 )
 
+instrument_track = InstrumentTrack(
+    instrument=instrument,
+    difficulty=difficulty,
+    note_events=[note_event],
+    star_power_events=[star_power_event],
+    track_events=[track_event],
+)
+
 # https://stackoverflow.com/a/1845097
 unmatchable_regex = r"(?!x)x"
 
 invalid_chart_line = "this_line_is_invalid"
-invalid_chart_lines = [invalid_chart_line]
+invalid_chart_lines = (invalid_chart_line,)
@@ -15,14 +15,14 @@ from tests.helpers import defaults
 
 def GlobalEventsTrackWithDefaults(
     *,
-    text_events: Sequence[TextEvent] = [defaults.text_event],
-    section_events: Sequence[SectionEvent] = [defaults.section_event],
-    lyric_events: Sequence[LyricEvent] = [defaults.lyric_event],
+    text_events: Sequence[TextEvent] = (defaults.text_event,),
+    section_events: Sequence[SectionEvent] = (defaults.section_event,),
+    lyric_events: Sequence[LyricEvent] = (defaults.lyric_event,),
 ) -> GlobalEventsTrack:
     return GlobalEventsTrack(
-        text_events=text_events,
-        section_events=section_events,
-        lyric_events=lyric_events,
+        text_events=list(text_events),
+        section_events=list(section_events),
+        lyric_events=list(lyric_events),
     )
 
 
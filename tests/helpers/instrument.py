@@ -28,16 +28,16 @@ def InstrumentTrackWithDefaults(
     *,
     instrument: Instrument = defaults.instrument,
     difficulty: Difficulty = defaults.difficulty,
-    note_events: Sequence[NoteEvent] = [defaults.note_event],
-    star_power_events: Sequence[StarPowerEvent] = [defaults.star_power_event],
-    track_events: Sequence[TrackEvent] = [defaults.track_event],
+    note_events: Sequence[NoteEvent] = (defaults.note_event,),
+    star_power_events: Sequence[StarPowerEvent] = (defaults.star_power_event,),
+    track_events: Sequence[TrackEvent] = (defaults.track_event,),
 ) -> InstrumentTrack:
     return InstrumentTrack(
         instrument=instrument,
         difficulty=difficulty,
-        note_events=note_events,
-        star_power_events=star_power_events,
-        track_events=track_events,
+        note_events=list(note_events),
+        star_power_events=list(star_power_events),
+        track_events=list(track_events),
     )
 
 
@@ -99,11 +99,25 @@ def NoteEventWithDefaults(
     star_power_data: StarPowerData | None = None,
     _proximal_bpm_event_index: int = defaults.proximal_bpm_event_index,
 ) -> NoteEvent:
+    return NoteEvent(
+        tick=Tick(tick),
+        timestamp=Timestamp(timestamp),
+        end_timestamp=Timestamp(end_timestamp),
+        note=note,
+        hopo_state=hopo_state,
+        sustain=_to_complex_sustain(sustain),
+        star_power_data=star_power_data,
+        _proximal_bpm_event_index=_proximal_bpm_event_index,
+    )
+
+
+def _to_complex_sustain(
+    sustain: tuple[int | None, int | None, int | None, int | None, int | None] | int
+) -> ComplexSustain:
     # TODO(P2): This is probably correct logic, but it would be preferable if it could be more
     # trivially correct. I don't want to write tests for these.
-    cs: ComplexSustain
     if isinstance(sustain, tuple):
-        cs = SustainTuple(
+        return SustainTuple(
             (
                 Ticks(sustain[0]) if sustain[0] is not None else None,
                 Ticks(sustain[1]) if sustain[1] is not None else None,
@@ -113,21 +127,10 @@ def NoteEventWithDefaults(
             )
         )
     elif isinstance(sustain, int):
-        cs = Ticks(sustain)
+        return Ticks(sustain)
     else:
         raise UnreachableError("unhandled sustain type")
 
-    return NoteEvent(
-        tick=Tick(tick),
-        timestamp=Timestamp(timestamp),
-        end_timestamp=Timestamp(end_timestamp),
-        note=note,
-        hopo_state=hopo_state,
-        sustain=cs,
-        star_power_data=star_power_data,
-        _proximal_bpm_event_index=_proximal_bpm_event_index,
-    )
-
 
 def NoteEventParsedDataWithDefaults(
     *,
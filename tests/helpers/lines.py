@@ -3,8 +3,9 @@ from chartparse.tick import Tick, Ticks
 
 
 def generate_bpm_line(tick: Tick, bpm: float) -> str:
-    bpm_sans_decimal_point = int(bpm * 1000)
-    if bpm_sans_decimal_point != bpm * 1000:
+    bpm_times_1000 = bpm * 1000
+    bpm_sans_decimal_point = int(bpm_times_1000)
+    if bpm_sans_decimal_point != bpm_times_1000:
         raise ValueError(f"bpm {bpm} has more than 3 decimal places")
     return f"  {tick} = B {bpm_sans_decimal_point}"
 
@@ -1,17 +1,24 @@
+import functools
+import re
+
 import pytest
 
 
 class LogChecker(object):
+    __slots__ = ("caplog",)
+
     def __init__(self, caplog: pytest.LogCaptureFixture) -> None:
         self.caplog = caplog
 
     def assert_contains_string_in_n_lines(self, s: str, n: int) -> None:
-        lines = self.caplog.text.splitlines()
-        matches = 0
-        for line in lines:
-            if s in line:
-                matches += 1
+        matches = len(_line_containing_regex_prog(s).findall(self.caplog.text))
         assert matches == n
 
     def assert_contains_string_in_one_line(self, s: str) -> None:
         self.assert_contains_string_in_n_lines(s, 1)
+
+
+@functools.lru_cache
+def _line_containing_regex_prog(s: str) -> re.Pattern[str]:
+    # Anchoring at line starts means each line yields at most one match.
+    return re.compile(f"^.*{re.escape(s)}", flags=re.MULTILINE)
@@ -12,14 +12,14 @@ from tests.helpers import defaults
 
 def SyncTrackWithDefaults(
     *,
-    time_signature_events: Sequence[TimeSignatureEvent] = [defaults.time_signature_event],
+    time_signature_events: Sequence[TimeSignatureEvent] = (defaults.time_signature_event,),
     bpm_events: BPMEvents = defaults.bpm_events,
-    anchor_events: Sequence[AnchorEvent] = [defaults.anchor_event],
+    anchor_events: Sequence[AnchorEvent] = (defaults.anchor_event,),
 ) -> SyncTrack:
     return SyncTrack(
-        time_signature_events=time_signature_events,
+        time_signature_events=list(time_signature_events),
         bpm_events=bpm_events,
-        anchor_events=anchor_events,
+        anchor_events=list(anchor_events),
     )
 
 
@@ -88,10 +88,10 @@ class BPMEventsWithMock(typ.Protocol):
 
 def BPMEventsWithDefaults(
     *,
-    events: Sequence[BPMEvent] = [defaults.bpm_event],
+    events: Sequence[BPMEvent] = (defaults.bpm_event,),
     resolution: Ticks | int = defaults.resolution,
 ) -> BPMEvents:
-    return BPMEvents(events=events, resolution=Ticks(resolution))
+    return BPMEvents(events=list(events), resolution=Ticks(resolution))
 
 
 def AnchorEventWithDefaults(
@@ -1,5 +1,6 @@
+import collections
 import typing as typ
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
 
 import _pytest
 import pytest
@@ -34,6 +35,7 @@ def parametrize(
     param_names_with_default_values = set(_default_values.keys())
     if not param_names_with_default_values.issubset(unique_param_names):
         raise ValueError("default_values keys must be a subset of param names")
+    required_param_names = frozenset(unique_param_names - param_names_with_default_values)
 
     def _testcase_to_pytest_param(
         tc: Testcase | AnonymousTestcase,
@@ -48,9 +50,9 @@ def parametrize(
         else:
             raise UnreachableError(f"testcase {tc} has unhandled length")
 
-        present_input_param_names = testcase_params.keys() | _default_values.keys()
-        if present_input_param_names != unique_param_names:
-            missing_param_names = unique_param_names.difference(present_input_param_names)
+        testcase_param_names = testcase_params.keys()
+        if not required_param_names <= testcase_param_names <= unique_param_names:
+            missing_param_names = required_param_names - testcase_param_names
             raise ValueError(
                 "all params in input params must be present in either default_values or the "
                 "testcase itself;\n"
@@ -59,20 +61,15 @@ def parametrize(
                 f"{missing_param_names}"
             )
 
-        param_values_in_order = []
-        for param_name in ordered_param_names:
-            try:
-                param_value = testcase_params[param_name]
-            except KeyError:
-                param_value = _default_values[param_name]
-            param_values_in_order.append(param_value)
+        # ChainMap only writes to its first map, so the defaults need not be a mutable copy.
+        param_values = collections.ChainMap(
+            testcase_params, typ.cast(MutableMapping[str, typ.Any], _default_values)
+        )
+        param_values_in_order = [param_values[name] for name in ordered_param_names]
 
-        if testname is None:
-            return pytest.param(*param_values_in_order)
-        else:
-            return pytest.param(*param_values_in_order, id=testname)
+        return pytest.param(*param_values_in_order, id=testname)
 
     return pytest.mark.parametrize(
         ",".join(ordered_param_names),
-        [_testcase_to_pytest_param(tc) for tc in testcases],
+        list(map(_testcase_to_pytest_param, testcases)),
     )
@@ -5,12 +5,8 @@ example) runs into FrozenDataclassErrors. These functions allow you to circumven
 these in tests.
 """
 
-import typing as typ
+setattr = object.__setattr__
+"""Sets an attribute, bypassing any ``__setattr__`` override such as a frozen dataclass's."""
 
-
-def setattr(obj: typ.Any, attrname: str, value: typ.Any) -> None:
-    object.__setattr__(obj, attrname, value)
-
-
-def delattr(obj: typ.Any, attrname: str) -> None:
-    object.__delattr__(obj, attrname)
+delattr = object.__delattr__
+"""Deletes an attribute, bypassing any ``__delattr__`` override such as a frozen dataclass's."""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import io
 import pathlib
 import typing as typ
 import unittest.mock
@@ -31,6 +33,11 @@ _missing_global_events_track_chart_filepath = (
 _unhandled_data_section_chart_filepath = _chart_directory_filepath / "unhandled_data_section.chart"
 
 
+@functools.lru_cache
+def _read_chart_file(path: pathlib.Path) -> str:
+    return path.read_text(encoding="utf-8-sig")
+
+
 class TestChart(object):
     class TestInit(object):
         def test(
@@ -110,8 +117,9 @@ class TestChart(object):
 
             want_tracks = [(Instrument.GUITAR, Difficulty.EXPERT)]
 
-            with open(_valid_chart_filepath, "r", encoding="utf-8-sig") as f:
-                got = Chart.from_file(f, want_tracks=want_tracks)
+            got = Chart.from_file(
+                io.StringIO(_read_chart_file(_valid_chart_filepath)), want_tracks=want_tracks
+            )
 
             assert got == default_chart
 
@@ -142,45 +150,50 @@ class TestChart(object):
                 ),
             ],
         )
-        def test_invalid_chart(self, path: str) -> None:
-            with open(path, "r", encoding="utf-8-sig") as f, pytest.raises(ValueError):
-                _ = Chart.from_file(f)
+        def test_invalid_chart(self, path: pathlib.Path) -> None:
+            with pytest.raises(ValueError):
+                _ = Chart.from_file(io.StringIO(_read_chart_file(path)))
 
         def test_unhandled_data_section(self, caplog: pytest.LogCaptureFixture) -> None:
-            with open(_unhandled_data_section_chart_filepath, "r", encoding="utf-8-sig") as f:
-                _ = Chart.from_file(f)
+            f = io.StringIO(_read_chart_file(_unhandled_data_section_chart_filepath))
+            _ = Chart.from_file(f)
             logchecker = LogChecker(caplog)
             logchecker.assert_contains_string_in_one_line(
                 Chart._unhandled_data_section_log_msg_tmpl.format("Foo")
             )
 
+        def test_crlf_line_endings(self) -> None:
+            text = _read_chart_file(_valid_chart_filepath)
+            want = Chart.from_file(io.StringIO(text))
+            got = Chart.from_file(io.StringIO(text.replace("\n", "\r\n"), newline=""))
+            assert got == want
+
     class TestPartitionLinesByDataSection(object):
         def test(self) -> None:
-            with open(_valid_chart_filepath, "r", encoding="utf-8-sig") as f:
-                lines = f.read().splitlines()
+            lines = _read_chart_file(_valid_chart_filepath).splitlines()
 
             data_sections = Chart._partition_lines_by_data_section(lines)
 
-            def validate_lines(header_tag: str, want_lines: Sequence[str]) -> None:
+            def validate_lines(header_tag: str, want_lines: tuple[str, ...]) -> None:
                 assert header_tag in data_sections
                 lines = data_sections[header_tag]
-                assert list(lines) == want_lines
+                assert tuple(lines) == want_lines
 
             validate_lines(
                 "Events",
-                [
+                (
                     '  800 = E "section Section 1"',
                     '  1000 = E "phrase_start"',
                     '  1200 = E "lyric Lo-"',
                     '  1230 = E "lyric rem"',
                     '  1800 = E "lyric ip-"',
                     '  1840 = E "lyric sum"',
-                ],
+                ),
             )
 
             validate_lines(
                 "Song",
-                [
+                (
                     '  Name = "Song Name"',
                     '  Artist = "Artist Name"',
                     '  Charter = "Charter Name"',
@@ -195,24 +208,24 @@ class TestChart(object):
                     '  Genre = "rock"',
                     '  MediaType = "cd"',
                     '  MusicStream = "song.ogg"',
-                ],
+                ),
             )
 
             validate_lines(
                 "SyncTrack",
-                [
+                (
                     "  0 = TS 4",
                     "  0 = B 117000",
                     "  800 = B 120000",
                     "  1200 = B 90000",
                     "  1200 = TS 6 3",
                     "  1800 = B 100000",
-                ],
+                ),
             )
 
             validate_lines(
                 "ExpertSingle",
-                [
+                (
                     "  800 = N 0 0",
                     "  800 = N 2 0",
                     "  825 = N 0 0",
@@ -230,9 +243,31 @@ class TestChart(object):
                     "  1300 = N 0 0",
                     "  1300 = N 3 0",
                     "  2000 = N 0 0",
-                ],
+                ),
             )
 
+        def test_iterator(self) -> None:
+            lines = iter(
+                [
+                    "[Song]",
+                    "{",
+                    '  Name = "Song Name"',
+                    "}",
+                    "[SyncTrack]",
+                    "{",
+                    "  0 = TS 4",
+                    "  0 = B 117000",
+                    "}",
+                ]
+            )
+
+            got = Chart._partition_lines_by_data_section(lines)
+
+            assert got == {
+                "Song": ['  Name = "Song Name"'],
+                "SyncTrack": ["  0 = TS 4", "  0 = B 117000"],
+            }
+
         @testcase.parametrize(
             ["lines"],
             [
@@ -261,6 +296,21 @@ class TestChart(object):
                 _ = Chart._partition_lines_by_data_section(lines)
 
     class TestNotesPerSecond(object):
+        test_impl_note_events = (
+            NoteEventWithDefaults(
+                timestamp=Timestamp(timedelta(seconds=1)),
+                note=Note.GRY,
+            ),
+            NoteEventWithDefaults(
+                timestamp=Timestamp(timedelta(seconds=2)),
+                note=Note.RYB,
+            ),
+            NoteEventWithDefaults(
+                timestamp=Timestamp(timedelta(seconds=3)),
+                note=Note.YBO,
+            ),
+        )
+
         @testcase.parametrize(
             ["start_time", "end_time", "want"],
             [
@@ -293,22 +343,7 @@ class TestChart(object):
         def test_impl(
             self, minimal_chart: Chart, start_time: Timestamp, end_time: Timestamp, want: float
         ) -> None:
-            note_event1 = NoteEventWithDefaults(
-                timestamp=Timestamp(timedelta(seconds=1)),
-                note=Note.GRY,
-            )
-            note_event2 = NoteEventWithDefaults(
-                timestamp=Timestamp(timedelta(seconds=2)),
-                note=Note.RYB,
-            )
-            note_event3 = NoteEventWithDefaults(
-                timestamp=Timestamp(timedelta(seconds=3)),
-                note=Note.YBO,
-            )
-            test_notes_per_second_note_events = [note_event1, note_event2, note_event3]
-            got = minimal_chart._notes_per_second(
-                test_notes_per_second_note_events, start_time, end_time
-            )
+            got = minimal_chart._notes_per_second(self.test_impl_note_events, start_time, end_time)
             assert got == want
 
         @testcase.parametrize(
@@ -376,8 +411,7 @@ class TestChart(object):
             mocker.patch.object(
                 InstrumentTrack,
                 "last_note_end_timestamp",
-                new_callable=mocker.PropertyMock,
-                return_value=want_end_time,
+                new=property(lambda _: want_end_time),
             )
 
             # NOTE: This _should_ be mocked with patch, but because bpm_events is a frozen
@@ -397,12 +431,6 @@ class TestChart(object):
             )
             mock.assert_called_once_with([defaults.note_event], want_start_time, want_end_time)
 
-            # NOTE: Manually reset timestamp_at_tick_no_optimize_return from mocked version.
-            unsafe.delattr(
-                minimal_chart.sync_track.bpm_events,
-                "timestamp_at_tick_no_optimize_return",
-            )
-
         @testcase.parametrize(
             ["start_time", "end_time", "want_start_time", "want_end_time"],
             [
@@ -440,8 +468,7 @@ class TestChart(object):
             mocker.patch.object(
                 InstrumentTrack,
                 "last_note_end_timestamp",
-                new_callable=mocker.PropertyMock,
-                return_value=want_end_time,
+                new=property(lambda _: want_end_time),
             )
 
             mock = mocker.patch.object(minimal_chart, "_notes_per_second")
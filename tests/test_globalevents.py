@@ -133,6 +133,7 @@ class TestGlobalEvent(object):
     class TestParsedData(object):
         class TestFromChartLine(object):
             test_regex = r"^T (\d+?) V (.*?)$"
+            test_regex_prog = re.compile(test_regex)
 
             def test(self, mocker: typ.Any) -> None:
                 got = GlobalEvent.ParsedData.from_chart_line(
@@ -147,7 +148,7 @@ class TestGlobalEvent(object):
 
             def setup_method(self) -> None:
                 GlobalEvent.ParsedData._regex = self.test_regex
-                GlobalEvent.ParsedData._regex_prog = re.compile(GlobalEvent.ParsedData._regex)
+                GlobalEvent.ParsedData._regex_prog = self.test_regex_prog
 
             def teardown_method(self) -> None:
                 del GlobalEvent.ParsedData._regex
@@ -856,6 +856,7 @@ class TestNoteEvent(object):
     class TestParsedData(object):
         class TestFromChartLine(object):
             test_regex = r"^T (\d+?) I (\d+?) S (\d+?)$"
+            test_regex_prog = re.compile(test_regex)
 
             tick = Tick(4)
 
@@ -918,12 +919,10 @@ class TestNoteEvent(object):
                 # because you "can't apply this __setattr_ to ABCMeta object".
                 if typ.TYPE_CHECKING:
                     unsafe.setattr(NoteEvent.ParsedData, "_regex", self.test_regex)
-                    unsafe.setattr(
-                        NoteEvent.ParsedData, "_regex_prog", re.compile(self.test_regex)
-                    )
+                    unsafe.setattr(NoteEvent.ParsedData, "_regex_prog", self.test_regex_prog)
                 else:
                     NoteEvent.ParsedData._regex = self.test_regex
-                    NoteEvent.ParsedData._regex_prog = re.compile(self.test_regex)
+                    NoteEvent.ParsedData._regex_prog = self.test_regex_prog
 
             def teardown_method(self) -> None:
                 del NoteEvent.ParsedData._regex
@@ -1135,6 +1134,7 @@ class TestSpecialEvent(object):
     class TestParsedData(object):
         class TestFromChartLine(object):
             test_regex = r"^T (\d+?) V (.*?)$"
+            test_regex_prog = re.compile(test_regex)
 
             def test(self, mocker: typ.Any) -> None:
                 got = SpecialEvent.ParsedData.from_chart_line(
@@ -1149,7 +1149,7 @@ class TestSpecialEvent(object):
 
             def setup_method(self) -> None:
                 SpecialEvent.ParsedData._regex = self.test_regex
-                SpecialEvent.ParsedData._regex_prog = re.compile(self.test_regex)
+                SpecialEvent.ParsedData._regex_prog = self.test_regex_prog
 
             def teardown_method(self) -> None:
                 del SpecialEvent.ParsedData._regex